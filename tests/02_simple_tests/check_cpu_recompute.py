@@ -95,7 +95,7 @@ def main():
     gnu.current_result.set("cpu_pct", "777")
 
     output_path = Path(gnu.current_tmp_fn())
-    output_path.write_text("2.0\t1.0\t0.5\t9999%\t123\t4\t5\t6\t7\t8\n", encoding="utf-8")
+    output_path.write_text("2.0\t1.0\t0.5\t9999%\t123\t4\t5\t6\t7\t8\t9\t10\t11\t1000\n", encoding="utf-8")
 
     gnu._parse_result()
 
@@ -104,6 +104,17 @@ def main():
         "777",
         "GNU percent_cpu should be ignored during backend parsing",
     )
+    for key, expected in (
+        ("voluntary_ctx_switches", "9"),
+        ("involuntary_ctx_switches", "10"),
+        ("signals", "11"),
+        ("avg_total_mem_kb", 1024),
+    ):
+        assert_equal(
+            gnu.current_result[key],
+            expected,
+            f"GNU {key} should be parsed from its format field (KiB normalized to kB)",
+        )
 
     gnu._set_cpu_time()
     gnu._set_cpu_pct()
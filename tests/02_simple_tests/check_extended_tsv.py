@@ -20,6 +20,12 @@ EXPECTED_HEADER = [
     "major_page_faults",
     "minor_page_faults",
     "swaps",
+    "voluntary_ctx_switches",
+    "involuntary_ctx_switches",
+    "signals",
+    "avg_total_mem_kb",
+    "read_bytes",
+    "write_bytes",
     "status",
     "exit_code",
     "command",
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import importlib.util
+import sys
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+
+
+def fail(message):
+    print(f"ERROR: {message}", file=sys.stderr)
+    raise SystemExit(1)
+
+
+def load_galitime_module():
+    module_path = Path(__file__).resolve().parents[2] / "galitime"
+    loader = SourceFileLoader("galitime_script", str(module_path))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    if spec is None or spec.loader is None:
+        fail(f"unable to load {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def assert_equal(actual, expected, message):
+    if actual != expected:
+        fail(f"{message}: expected {expected!r}, got {actual!r}")
+
+
+def main():
+    mod = load_galitime_module()
+
+    # MacTime.__init__ refuses non-Darwin platforms; only the parsing is tested here.
+    mac = mod.MacTime.__new__(mod.MacTime)
+    mac.debug = False
+    mac.current_result = mod.TimingResult(
+        experiment="demo",
+        run=1,
+        command="true",
+        extended=True,
+        backend=mod.BACKEND_BSD,
+    )
+    mac._read_mactime_dict = lambda: {
+        "real": "2.00",
+        "user": "1.00",
+        "sys": "0.50",
+        "maximum resident set size": 2000000,
+        "average shared memory size": 100,
+        "average unshared data size": 200,
+        "average unshared stack size": 700,
+        "page reclaims": 7,
+        "page faults": 6,
+        "swaps": 8,
+        "block input operations": 4,
+        "block output operations": 5,
+        "signals received": 11,
+        "voluntary context switches": 9,
+        "involuntary context switches": 10,
+    }
+    mac._parse_result()
+
+    for key, expected in (
+        ("max_ram_kb", 2000),
+        ("fs_input_ops", 4),
+        ("fs_output_ops", 5),
+        ("major_page_faults", 6),
+        ("minor_page_faults", 7),
+        ("swaps", 8),
+        ("voluntary_ctx_switches", 9),
+        ("involuntary_ctx_switches", 10),
+        ("signals", 11),
+        # (100 + 200 + 700) KiB normalized to kB
+        ("avg_total_mem_kb", 1024),
+        ("read_bytes", mod.NA_VALUE),
+        ("write_bytes", mod.NA_VALUE),
+    ):
+        assert_equal(mac.current_result[key], expected, f"BSD {key} mapping")
+
+
+if __name__ == "__main__":
+    main()
@@ -59,6 +59,12 @@ def main():
         "major_page_faults",
         "minor_page_faults",
         "swaps",
+        "voluntary_ctx_switches",
+        "involuntary_ctx_switches",
+        "signals",
+        "avg_total_mem_kb",
+        "read_bytes",
+        "write_bytes",
     ):
         if extended_result[key] != mod.NA_VALUE:
             fail(f"expected {key}=NA, got {extended_result[key]!r}")
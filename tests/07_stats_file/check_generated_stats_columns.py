@@ -34,6 +34,8 @@ def main():
         "runs_failed",
         "runs_timeout",
         "runs_timing_error",
+        "runs_oom",
+        "runs_cpu_limit",
         "final_status",
         "final_exit_code",
     )
@@ -53,6 +55,12 @@ def main():
         "major_page_faults",
         "minor_page_faults",
         "swaps",
+        "voluntary_ctx_switches",
+        "involuntary_ctx_switches",
+        "signals",
+        "avg_total_mem_kb",
+        "read_bytes",
+        "write_bytes",
     )
 
     if mod.STATS_PREFIX_COLUMNS != expected_prefix:
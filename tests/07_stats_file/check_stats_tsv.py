@@ -14,6 +14,8 @@ STATS_PREFIX_COLUMNS = [
     "runs_failed",
     "runs_timeout",
     "runs_timing_error",
+    "runs_oom",
+    "runs_cpu_limit",
     "final_status",
     "final_exit_code",
 ]
@@ -33,6 +35,12 @@ EXTENDED_STATS_NUMERIC_METRICS = BASE_STATS_NUMERIC_METRICS + [
     "major_page_faults",
     "minor_page_faults",
     "swaps",
+    "voluntary_ctx_switches",
+    "involuntary_ctx_switches",
+    "signals",
+    "avg_total_mem_kb",
+    "read_bytes",
+    "write_bytes",
 ]
 
 
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+import argparse
+import sqlite3
+import sys
+
+
+EXPECTED_COLUMNS = [
+    "id",
+    "timestamp",
+    "host",
+    "experiment",
+    "run",
+    "real_s",
+    "user_s",
+    "sys_s",
+    "cpu_s",
+    "cpu_pct",
+    "max_ram_kb",
+    "backend",
+    "fs_input_ops",
+    "fs_output_ops",
+    "major_page_faults",
+    "minor_page_faults",
+    "swaps",
+    "voluntary_ctx_switches",
+    "involuntary_ctx_switches",
+    "signals",
+    "avg_total_mem_kb",
+    "read_bytes",
+    "write_bytes",
+    "status",
+    "exit_code",
+    "command",
+]
+EXPECTED_INDEX_COLUMNS = ["experiment", "command", "timestamp"]
+
+
+def fail(message):
+    print(f"ERROR: {message}", file=sys.stderr)
+    raise SystemExit(1)
+
+
+def parse_expectation(item, parts):
+    fields = item.split("=", parts - 1)
+    if len(fields) != parts:
+        fail(f"invalid expectation: {item!r}")
+    return fields
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("db")
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--expect-count", action="append", default=[])
+    parser.add_argument("--expect-latest", action="append", default=[])
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    conn.row_factory = sqlite3.Row
+
+    # columns added to an existing store by schema evolution are appended at the end
+    columns = [row["name"] for row in conn.execute("PRAGMA table_info(runs)")]
+    if sorted(columns) != sorted(EXPECTED_COLUMNS):
+        fail(f"{args.db}: unexpected columns: {columns}")
+
+    indexed = [
+        [row["name"] for row in conn.execute(f"PRAGMA index_info({index['name']!r})")]
+        for index in conn.execute("PRAGMA index_list(runs)")
+    ]
+    if EXPECTED_INDEX_COLUMNS not in indexed:
+        fail(f"{args.db}: missing index on {EXPECTED_INDEX_COLUMNS}, found {indexed}")
+
+    (rows, ) = conn.execute("SELECT COUNT(*) FROM runs").fetchone()
+    if rows != args.rows:
+        fail(f"{args.db}: has {rows} rows, expected {args.rows}")
+
+    for item in args.expect_count:
+        experiment, expected = parse_expectation(item, 2)
+        (actual, ) = conn.execute(
+            "SELECT COUNT(*) FROM runs WHERE experiment = ?", (experiment, )
+        ).fetchone()
+        if actual != int(expected):
+            fail(f"{args.db}: expected {expected} rows for {experiment!r}, got {actual}")
+
+    for item in args.expect_latest:
+        experiment, key, expected = parse_expectation(item, 3)
+        if key not in EXPECTED_COLUMNS:
+            fail(f"invalid expectation key: {key!r}")
+        latest = conn.execute(
+            "SELECT * FROM runs WHERE experiment = ? ORDER BY timestamp DESC, run DESC LIMIT 1",
+            (experiment, ),
+        ).fetchone()
+        if latest is None:
+            fail(f"{args.db}: no rows for {experiment!r}")
+        actual = latest[key]
+        if str(actual) != expected:
+            fail(f"{args.db}: expected latest {experiment!r} {key}={expected!r}, got {actual!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import importlib.util
+import subprocess
+import sys
+import time
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+
+
+def fail(message):
+    print(f"ERROR: {message}", file=sys.stderr)
+    raise SystemExit(1)
+
+
+def load_galitime_module():
+    module_path = Path(__file__).resolve().parents[2] / "galitime"
+    loader = SourceFileLoader("galitime_script", str(module_path))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    if spec is None or spec.loader is None:
+        fail(f"unable to load {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    mod = load_galitime_module()
+
+    class DummyTime(mod.AbstractTime):
+        def __init__(self):
+            super().__init__(
+                command="true",
+                shell="/bin/sh",
+                experiment="demo",
+                time="dummy",
+                mem_limit_kb=1000,
+                cpu_limit_s=1,
+            )
+            self.wrapper = lambda: "true"
+
+        def _parse_result(self):
+            raise AssertionError("not used in this test")
+
+    timing = DummyTime()
+    timing.current_result = mod.TimingResult(experiment="demo", run=1, command="true")
+
+    # a process that cannot be killed must not abort limit enforcement
+    def kill_denied(pid, sig):
+        raise PermissionError(1, "Operation not permitted")
+
+    real_kill = mod.os.kill
+    mod.os.kill = kill_denied
+    try:
+        timing._kill_for_limit(1, mod.STATUS_OOM, "test")
+    finally:
+        mod.os.kill = real_kill
+    if timing.current_result["status"] != mod.NA_VALUE:
+        fail(f"status set although the kill failed: {timing.current_result['status']!r}")
+
+    # a failing enforcement must kill and reap the whole tree before propagating
+    def enforce_broken(shell_pid):
+        raise RuntimeError("enforcement failed")
+
+    timing._enforce_limits = enforce_broken
+    timing._read_shell_pid = lambda: process.pid
+    process = subprocess.Popen(["/bin/sh", "-c", "sleep 30; true"])
+    start = time.monotonic()
+    try:
+        timing._wait(process, timeout=None)
+    except RuntimeError:
+        pass
+    else:
+        fail("enforcement error was not propagated")
+    if process.returncode is None:
+        fail("wrapped process was not reaped")
+    if time.monotonic() - start > 10:
+        fail("wrapped process was not killed")
+
+
+if __name__ == "__main__":
+    main()